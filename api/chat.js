@@ -1,6 +1,112 @@
 // Serverless function for OpenAI API calls
 // This can be deployed to Vercel, Netlify, or similar platforms
 
+import { createHash } from 'crypto';
+
+// OpenAI chat completions endpoint
+const OPENAI_URL = 'https://api.openai.com/v1/chat/completions';
+
+// Every request starts with the same CV system prompt. OpenAI caches long
+// identical prompt prefixes automatically; a stable cache key routes these
+// requests to the same cache so the system prompt is not re-processed each turn.
+const PROMPT_CACHE_KEY = process.env.OPENAI_PROMPT_CACHE_KEY || 'cv-chatbot';
+
+// Time to wait for a streamed OpenAI response to start before retrying. Two
+// attempts stay under the client's 30 second timeout for response headers,
+// so a stalled request is retried instead of holding the function until it
+// is killed. Invalid values (e.g. "12s") fall back to the default.
+const DEFAULT_OPENAI_TIMEOUT_MS = 12000;
+const OPENAI_TIMEOUT_MS = parsePositiveNumber(process.env.OPENAI_TIMEOUT_MS, DEFAULT_OPENAI_TIMEOUT_MS);
+const OPENAI_ATTEMPTS = 2;
+
+function parsePositiveNumber(value, fallback) {
+  const parsed = Number(value);
+  return Number.isFinite(parsed) && parsed > 0 ? parsed : fallback;
+}
+
+// Longest gap allowed between streamed chunks before the stream is abandoned.
+// Kept below the client's idle timeout so the client receives an error event.
+const STREAM_IDLE_TIMEOUT_MS = 10000;
+
+// Headers for Server-Sent Events responses
+const SSE_HEADERS = {
+  'Content-Type': 'text/event-stream',
+  'Cache-Control': 'no-cache',
+  'Connection': 'keep-alive',
+};
+
+// In-memory LRU cache of completed responses, shared by requests hitting the
+// same warm instance. Repeated questions (e.g. "what is your ML experience?")
+// are answered without calling OpenAI at all.
+const RESPONSE_CACHE_MAX_ENTRIES = 512;
+const RESPONSE_CACHE_TTL_MS = 60 * 60 * 1000; // 1 hour
+const responseCache = new Map();
+
+// Key on everything that determines the completion
+function getCacheKey(model, maxTokens, temperature, messages) {
+  return createHash('sha256')
+    .update(JSON.stringify([model, maxTokens, temperature, messages]))
+    .digest('hex');
+}
+
+function getCachedResponse(key) {
+  const entry = responseCache.get(key);
+  if (!entry) return undefined;
+
+  if (entry.expiresAt <= Date.now()) {
+    responseCache.delete(key);
+    return undefined;
+  }
+
+  // Re-insert to mark as most recently used (Map preserves insertion order)
+  responseCache.delete(key);
+  responseCache.set(key, entry);
+  return entry.data;
+}
+
+// Outcomes shared with waiting requests when the leading request fails
+// without a status of its own
+const INTERNAL_ERROR_OUTCOME = { status: 500, body: { error: 'Internal server error' } };
+const STREAM_FAILED_OUTCOME = { status: 502, body: { error: 'AI service temporarily unavailable' } };
+
+// Send an error response and return it as an outcome for waiting requests
+function sendError(res, status, body) {
+  res.status(status).json(body);
+  return { status, body };
+}
+
+// Send the outcome of a shared request
+function sendOutcome(res, outcome, stream) {
+  if (outcome.content) {
+    return sendContent(res, outcome.content, stream);
+  }
+  res.status(outcome.status).json(outcome.body);
+}
+
+// Send already-available content, matching the shape of a live response
+function sendContent(res, content, stream) {
+  if (stream) {
+    res.writeHead(200, SSE_HEADERS);
+    res.end(`data: ${JSON.stringify({ done: true, data: content })}\n\n`);
+    return;
+  }
+  res.status(200).json({ success: true, data: content });
+}
+
+function setCachedResponse(key, data) {
+  responseCache.delete(key);
+  responseCache.set(key, { data, expiresAt: Date.now() + RESPONSE_CACHE_TTL_MS });
+
+  // Evict the least recently used entry
+  if (responseCache.size > RESPONSE_CACHE_MAX_ENTRIES) {
+    responseCache.delete(responseCache.keys().next().value);
+  }
+}
+
+// Requests currently waiting on OpenAI, keyed like the response cache.
+// Concurrent identical prompts await the first one instead of duplicating it.
+const inflightRequests = new Map();
+
 export default async function handler(req, res) {
   // Enable CORS
   res.setHeader('Access-Control-Allow-Origin', '*');
@@ -19,7 +125,7 @@ export default async function handler(req, res) {
   }
 
   try {
-    const { messages, model = 'gpt-3.5-turbo', maxTokens = 500, temperature = 0.3 } = req.body;
+    const { messages, model = 'gpt-3.5-turbo', maxTokens = 500, temperature = 0.3, stream = false } = req.body;
 
     // Validate input
     if (!messages || !Array.isArray(messages)) {
@@ -33,56 +139,215 @@ export default async function handler(req, res) {
       return res.status(500).json({ error: 'Server configuration error' });
     }
 
-    // Make request to OpenAI API
-    const openAIResponse = await fetch('https://api.openai.com/v1/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${apiKey}`,
-      },
-      body: JSON.stringify({
-        model,
-        messages,
-        max_tokens: maxTokens,
-        temperature,
-      }),
-    });
-
-    if (!openAIResponse.ok) {
-      const errorData = await openAIResponse.json().catch(() => ({}));
-      
-      // Handle different error types
-      switch (openAIResponse.status) {
-        case 401:
-          console.error('OpenAI API authentication failed');
-          return res.status(500).json({ error: 'Authentication failed' });
-        case 429:
-          return res.status(429).json({ error: 'Rate limit exceeded' });
-        case 400:
-          return res.status(400).json({ error: errorData.error?.message || 'Invalid request' });
-        default:
-          console.error('OpenAI API error:', openAIResponse.status, errorData);
-          return res.status(500).json({ error: 'AI service temporarily unavailable' });
-      }
+    // Serve repeated prompts from the response cache
+    const cacheKey = getCacheKey(model, maxTokens, temperature, messages);
+    const cachedResponse = getCachedResponse(cacheKey);
+    if (cachedResponse) {
+      return sendContent(res, cachedResponse, stream);
     }
 
-    const data = await openAIResponse.json();
-    
-    // Extract the response content
-    const messageContent = data.choices[0]?.message?.content;
-    if (!messageContent) {
-      return res.status(500).json({ error: 'No response content received' });
+    // Share the outcome of an identical request that is already in flight.
+    // Errors are shared too, so a struggling upstream is not retried once per
+    // waiting request.
+    const pendingOutcome = inflightRequests.get(cacheKey);
+    if (pendingOutcome) {
+      return sendOutcome(res, await pendingOutcome, stream);
     }
 
-    // Return the response
-    res.status(200).json({
-      success: true,
-      data: messageContent.trim(),
-      usage: data.usage // Optional: include token usage info
-    });
+    let resolvePending;
+    const pending = new Promise(resolve => { resolvePending = resolve; });
+    inflightRequests.set(cacheKey, pending);
+
+    let outcome = INTERNAL_ERROR_OUTCOME;
+    try {
+      outcome = await completeChat(res, apiKey, { model, messages, maxTokens, temperature, stream });
+      if (outcome.content) {
+        setCachedResponse(cacheKey, outcome.content);
+      }
+    } finally {
+      inflightRequests.delete(cacheKey);
+      resolvePending(outcome);
+    }
 
   } catch (error) {
     console.error('Server error:', error);
+    if (res.headersSent) {
+      res.end();
+      return;
+    }
     res.status(500).json({ error: 'Internal server error' });
   }
-}
\ No newline at end of file
+}
+
+// Request a completion from OpenAI and write it to the client.
+// Resolves to the outcome: { content } on success, or the { status, body }
+// of the error response that was sent.
+async function completeChat(res, apiKey, { model, messages, maxTokens, temperature, stream }) {
+  // Make request to OpenAI API
+  const openAIResponse = await fetchWithTimeout(stream, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Authorization': `Bearer ${apiKey}`,
+    },
+    body: JSON.stringify({
+      model,
+      messages,
+      max_tokens: maxTokens,
+      temperature,
+      prompt_cache_key: PROMPT_CACHE_KEY,
+      ...(stream && { stream: true }),
+    }),
+  });
+
+  if (!openAIResponse) {
+    console.error(`OpenAI API timed out after ${OPENAI_ATTEMPTS} attempts`);
+    return sendError(res, 504, { error: 'AI service timed out' });
+  }
+
+  if (!openAIResponse.ok) {
+    const errorData = await openAIResponse.json().catch(() => ({}));
+    
+    // Handle different error types
+    switch (openAIResponse.status) {
+      case 401:
+        console.error('OpenAI API authentication failed');
+        return sendError(res, 500, { error: 'Authentication failed' });
+      case 429:
+        return sendError(res, 429, { error: 'Rate limit exceeded' });
+      case 400:
+        return sendError(res, 400, { error: errorData.error?.message || 'Invalid request' });
+      default:
+        console.error('OpenAI API error:', openAIResponse.status, errorData);
+        return sendError(res, 500, { error: 'AI service temporarily unavailable' });
+    }
+  }
+
+  // Forward tokens to the client as Server-Sent Events as they are generated
+  if (stream) {
+    const streamedContent = await streamResponse(openAIResponse, res);
+    return streamedContent ? { content: streamedContent } : STREAM_FAILED_OUTCOME;
+  }
+
+  const data = await openAIResponse.json();
+  
+  // Extract the response content
+  const messageContent = data.choices[0]?.message?.content;
+  if (!messageContent) {
+    return sendError(res, 500, { error: 'No response content received' });
+  }
+
+  // Return the response in the same minimal shape as cached responses
+  const content = messageContent.trim();
+  res.status(200).json({ success: true, data: content });
+
+  return { content };
+}
+
+// Call OpenAI, retrying streamed requests that do not respond within
+// OPENAI_TIMEOUT_MS. The timeout only covers waiting for the response headers,
+// which a stream sends right away, so a long streamed body is never cut off.
+// Non-streamed completions send headers only after the whole generation, so
+// they are not timed. Resolves to null if every attempt timed out.
+async function fetchWithTimeout(stream, options) {
+  if (!stream) {
+    return fetch(OPENAI_URL, options);
+  }
+
+  for (let attempt = 0; attempt < OPENAI_ATTEMPTS; attempt++) {
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), OPENAI_TIMEOUT_MS);
+
+    try {
+      return await fetch(OPENAI_URL, { ...options, signal: controller.signal });
+    } catch (error) {
+      if (error.name !== 'AbortError') {
+        throw error;
+      }
+      console.warn(`OpenAI API attempt ${attempt + 1} timed out`);
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
+  return null;
+}
+
+// Relay an OpenAI streaming completion to the client as SSE events.
+// Each event carries the new text delta; the final event carries the
+// accumulated content so the client can reconcile.
+// Resolves to the full content, or null if the stream failed.
+async function streamResponse(openAIResponse, res) {
+  res.writeHead(200, SSE_HEADERS);
+
+  const reader = openAIResponse.body.getReader();
+  const decoder = new TextDecoder();
+  const parts = [];
+  let buffer = '';
+  let completed = false;
+
+  try {
+    while (true) {
+      const { done, value } = await readWithIdleTimeout(reader);
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+
+      for (const line of lines) {
+        if (!line.startsWith('data: ')) continue;
+
+        const payload = line.slice(6).trim();
+        if (payload === '[DONE]') {
+          completed = true;
+          continue;
+        }
+
+        const chunk = JSON.parse(payload);
+        const delta = chunk.choices?.[0]?.delta?.content;
+        if (delta) {
+          parts.push(delta);
+          res.write(`data: ${JSON.stringify({ delta })}\n\n`);
+        }
+      }
+    }
+
+    // Without OpenAI's end marker the content is truncated
+    if (!completed) {
+      throw new Error('OpenAI stream ended before completion');
+    }
+
+    const content = parts.join('').trim();
+    if (!content) {
+      res.write(`data: ${JSON.stringify({ error: 'No response content received' })}\n\n`);
+      return null;
+    }
+
+    res.write(`data: ${JSON.stringify({ done: true, data: content })}\n\n`);
+    return content;
+  } catch (error) {
+    console.error('Streaming error:', error);
+    res.write(`data: ${JSON.stringify({ error: 'AI service temporarily unavailable' })}\n\n`);
+    return null;
+  } finally {
+    res.end();
+  }
+}
+
+// Read the next chunk from an upstream stream, cancelling it if it stalls
+async function readWithIdleTimeout(reader) {
+  let timeoutId;
+  const idleTimeout = new Promise((_, reject) => {
+    timeoutId = setTimeout(() => {
+      reject(new Error('OpenAI stream idle timeout'));
+      reader.cancel().catch(() => {});
+    }, STREAM_IDLE_TIMEOUT_MS);
+  });
+
+  try {
+    return await Promise.race([reader.read(), idleTimeout]);
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
@@ -1,22 +1,68 @@
-
 import express from 'express';
+import cluster from 'cluster';
 import path from 'path';
 import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const app = express();
+// Number of worker processes; each gets its own event loop and shares the port
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY || '1');
+
+if (WORKERS > 1 && cluster.isPrimary) {
+  for (let i = 0; i < WORKERS; i++) {
+    cluster.fork();
+  }
+
+  // Replace workers that crash so capacity stays constant, with a delay and a
+  // crash-rate limit so a worker that fails at startup can't spin a fork loop
+  const RESTART_DELAY_MS = 1000;
+  const MAX_CRASHES = 5;
+  const CRASH_WINDOW_MS = 60 * 1000;
+  let recentCrashes = [];
+
+  cluster.on('exit', (worker, code, signal) => {
+    // Workers stopped on purpose are not replaced
+    if (worker.exitedAfterDisconnect) return;
+
+    const now = Date.now();
+    recentCrashes = recentCrashes.filter(time => now - time < CRASH_WINDOW_MS);
+    recentCrashes.push(now);
+
+    if (recentCrashes.length > MAX_CRASHES) {
+      console.error(`Workers crashed ${recentCrashes.length} times in ${CRASH_WINDOW_MS / 1000}s, not restarting`);
+      if (Object.keys(cluster.workers).length === 0) {
+        process.exit(1);
+      }
+      return;
+    }
+
+    console.log(`Worker ${worker.process.pid} exited (${signal || code}), restarting in ${RESTART_DELAY_MS}ms`);
+    setTimeout(() => cluster.fork(), RESTART_DELAY_MS);
+  });
+} else {
+  const app = express();
+
+  // Cache headers below only take effect when this file is the entrypoint
+  // (node server.js); `npm run preview` serves the build with Vite instead.
+  // Vite fingerprints bundled assets with a content hash, so they never change
+  // under the same URL and browsers can cache them without revalidating
+  app.use('/assets', express.static(path.join(__dirname, 'dist', 'assets'), {
+    immutable: true,
+    maxAge: '1y',
+  }));
 
-// Serve static files from the 'dist' directory
-app.use(express.static(path.join(__dirname, 'dist')));
+  // Serve static files from the 'dist' directory. These are revalidated on
+  // each request via ETag / If-None-Match, so unchanged files return 304
+  app.use(express.static(path.join(__dirname, 'dist')));
 
-// For any request that doesn't match a static file, send the index.html
-app.get('*', (req, res) => {
-  res.sendFile(path.join(__dirname, 'dist', 'index.html'));
-});
+  // For any request that doesn't match a static file, send the index.html
+  app.get('*', (req, res) => {
+    res.sendFile(path.join(__dirname, 'dist', 'index.html'));
+  });
 
-const PORT = process.env.PORT || 8080;
-app.listen(PORT, () => {
-  console.log(`Server running on port ${PORT}`);
-});
+  const PORT = process.env.PORT || 8080;
+  app.listen(PORT, () => {
+    console.log(`Server running on port ${PORT}`);
+  });
+}
@@ -11,6 +11,9 @@ import { Card } from '../ui/card';
 import { Button } from '../ui/button';
 import { RefreshCw, AlertCircle, ChevronDown } from 'lucide-react';
 
+// Delay before persisting conversation changes to session storage
+const SAVE_DEBOUNCE_MS = 300;
+
 const ChatbotContainer: React.FC<ChatbotContainerProps> = ({ 
   className = '', 
   maxHeight = '400px' 
@@ -42,6 +45,9 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
     error: null
   });
 
+  // Whether an assistant response is currently streaming in
+  const [isStreaming, setIsStreaming] = useState(false);
+
   // TTS playback state management
   const [playbackStates, setPlaybackStates] = useState<Map<string, PlaybackState>>(new Map());
 
@@ -63,14 +69,34 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
       timestamp: new Date()
     };
 
+    // Keep history bounded to what session storage retains, so every save,
+    // validation pass and stats computation stays O(1) in conversation length
     setState(prevState => ({
       ...prevState,
-      messages: [...prevState.messages, newMessage]
+      messages: [...prevState.messages, newMessage].slice(-SessionStorageService.MAX_MESSAGES)
     }));
 
     return newMessage;
   };
 
+  // Update the content of an existing message (used while a response streams in)
+  const updateMessageContent = (messageId: string, content: string) => {
+    setState(prevState => ({
+      ...prevState,
+      messages: prevState.messages.map(msg =>
+        msg.id === messageId ? { ...msg, content } : msg
+      )
+    }));
+  };
+
+  // Remove a message from the conversation
+  const removeMessage = (messageId: string) => {
+    setState(prevState => ({
+      ...prevState,
+      messages: prevState.messages.filter(msg => msg.id !== messageId)
+    }));
+  };
+
   // Handle sending a message
   const handleSendMessage = async (content: string) => {
     // Mark that this is user-initiated interaction (not initial load)
@@ -78,7 +104,7 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
     setHasUserInteracted(true);
     
     // Add user message immediately
-    addMessage(content, 'user');
+    const userMessage = addMessage(content, 'user');
 
     // Set loading state
     setState(prevState => ({
@@ -88,21 +114,38 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
     }));
 
     try {
-      // Get current messages for context
-      const currentMessages = [...state.messages, {
-        id: generateMessageId(),
-        content,
-        role: 'user' as const,
-        timestamp: new Date()
-      }];
+      // Get current messages for context, reusing the message just added so
+      // the displayed and sent copies share one id and timestamp
+      const currentMessages = [...state.messages, userMessage];
+
+      // Render the assistant response incrementally as tokens stream in
+      let streamingMessageId: string | null = null;
+      const handleChunk = (partial: string) => {
+        if (streamingMessageId) {
+          updateMessageContent(streamingMessageId, partial);
+        } else {
+          streamingMessageId = addMessage(partial, 'assistant').id;
+          setIsStreaming(true);
+        }
+      };
 
       // Send to chatbot service
-      const response = await chatbotService.sendMessage(currentMessages);
+      const response = await chatbotService.sendMessage(currentMessages, undefined, handleChunk);
 
       if (response.success && response.data) {
-        // Add assistant response
-        addMessage(response.data, 'assistant');
+        if (streamingMessageId) {
+          // Replace streamed text with the final response
+          updateMessageContent(streamingMessageId, response.data);
+        } else {
+          // Add assistant response
+          addMessage(response.data, 'assistant');
+        }
       } else if (response.error) {
+        // Drop any partially streamed response
+        if (streamingMessageId) {
+          removeMessage(streamingMessageId);
+        }
+
         // Handle error
         setState(prevState => ({
           ...prevState,
@@ -123,6 +166,7 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
       }));
     } finally {
       // Clear loading state
+      setIsStreaming(false);
       setState(prevState => ({
         ...prevState,
         isLoading: false
@@ -371,16 +415,54 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
     }, 1000);
   }, []);
 
-  // Save messages to session storage when they change
-  useEffect(() => {
-    if (state.messages.length > 0) {
-      const saveSuccess = SessionStorageService.saveMessages(state.messages);
-      if (!saveSuccess) {
-        console.warn('Failed to save conversation to session storage');
-      }
+  // Latest messages and the pending deferred save, kept in refs so the save
+  // can be flushed on unmount or page hide instead of being dropped
+  const latestMessagesRef = useRef<Message[]>([]);
+  const pendingSaveRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  const saveConversation = () => {
+    pendingSaveRef.current = null;
+    const saveSuccess = SessionStorageService.saveMessages(latestMessagesRef.current);
+    if (!saveSuccess) {
+      console.warn('Failed to save conversation to session storage');
+    }
+  };
+
+  const cancelPendingSave = () => {
+    if (pendingSaveRef.current !== null) {
+      clearTimeout(pendingSaveRef.current);
+      pendingSaveRef.current = null;
     }
+  };
+
+  const flushPendingSave = () => {
+    if (pendingSaveRef.current !== null) {
+      clearTimeout(pendingSaveRef.current);
+      saveConversation();
+    }
+  };
+
+  // Save messages to session storage when they change. The write is deferred
+  // off the render path and coalesced, so a streaming response persists once
+  // it settles instead of serializing the history on every token.
+  useEffect(() => {
+    latestMessagesRef.current = state.messages;
+    cancelPendingSave();
+
+    if (state.messages.length === 0) return;
+
+    pendingSaveRef.current = setTimeout(saveConversation, SAVE_DEBOUNCE_MS);
   }, [state.messages]);
 
+  // Write any deferred save before the page is hidden or the chat unmounts
+  useEffect(() => {
+    window.addEventListener('pagehide', flushPendingSave);
+    return () => {
+      window.removeEventListener('pagehide', flushPendingSave);
+      flushPendingSave();
+    };
+  }, []);
+
   // Cleanup audio on unmount
   useEffect(() => {
     return () => {
@@ -480,7 +562,7 @@ const ChatbotContainer: React.FC<ChatbotContainerProps> = ({
           ))}
 
           {/* Typing indicator */}
-          <TypingIndicator visible={state.isLoading} />
+          <TypingIndicator visible={state.isLoading && !isStreaming} />
 
           {/* Auto-scroll anchor */}
           <div ref={messagesEndRef} />
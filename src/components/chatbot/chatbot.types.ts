@@ -16,6 +16,7 @@ export interface ChatbotConfig {
   model: string;
   maxMessages: number;
   apiTimeout: number;
+  streamIdleTimeout: number;
 }
 
 // OpenAI API request interface
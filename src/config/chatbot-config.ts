@@ -6,6 +6,7 @@ export interface ChatbotConfig {
   model: string;
   maxMessages: number;
   apiTimeout: number;
+  streamIdleTimeout: number;
 }
 
 export const CHATBOT_CONFIG: ChatbotConfig = {
@@ -15,6 +16,7 @@ export const CHATBOT_CONFIG: ChatbotConfig = {
   model: import.meta.env.VITE_OPENAI_MODEL || 'gpt-3.5-turbo',
   maxMessages: 20, // Limit conversation history
   apiTimeout: 30000, // 30 seconds timeout
+  streamIdleTimeout: 15000, // 15 seconds without a streamed chunk
 };
 
 // Environment variable validation
@@ -162,6 +162,7 @@ export class AudioCacheService {
     // Update access statistics
     entry.accessCount++;
     entry.lastAccessed = Date.now();
+    this.markRecentlyUsed(key, entry);
     this.stats.hitCount++;
     
     return entry.audioData;
@@ -193,6 +194,7 @@ export class AudioCacheService {
     // Update access statistics
     entry.accessCount++;
     entry.lastAccessed = Date.now();
+    this.markRecentlyUsed(key, entry);
     this.stats.hitCount++;
     
     return entry.audioUrl;
@@ -372,28 +374,33 @@ export class AudioCacheService {
   private ensureSpace(requiredSize: number): void {
     // Check if we need to make space
     while (
-      this.cache.size >= this.config.maxEntries ||
-      this.stats.totalSize + requiredSize > this.config.maxSizeBytes
+      this.cache.size > 0 &&
+      (this.cache.size >= this.config.maxEntries ||
+        this.stats.totalSize + requiredSize > this.config.maxSizeBytes)
     ) {
       this.evictLeastRecentlyUsed();
     }
   }
 
+  /**
+   * Move entry to the end of the cache so Map order tracks recency
+   * @param key - Cache key
+   * @param entry - Cache entry that was accessed
+   */
+  private markRecentlyUsed(key: string, entry: AudioCacheEntry): void {
+    this.cache.delete(key);
+    this.cache.set(key, entry);
+  }
+
   /**
    * Evict the least recently used entry
    */
   private evictLeastRecentlyUsed(): void {
-    let oldestKey: string | null = null;
-    let oldestTime = Date.now();
-    
-    for (const [key, entry] of this.cache) {
-      if (entry.lastAccessed < oldestTime) {
-        oldestTime = entry.lastAccessed;
-        oldestKey = key;
-      }
-    }
+    // Map iterates in insertion order, and accesses re-insert entries,
+    // so the first key is always the least recently used
+    const oldestKey = this.cache.keys().next().value;
     
-    if (oldestKey) {
+    if (oldestKey !== undefined) {
       this.removeEntry(oldestKey);
       this.stats.evictionCount++;
     }
@@ -11,6 +11,18 @@ import { conversationContextService } from './conversation-context-service';
 // Update the config with the system prompt
 CHATBOT_CONFIG.systemPrompt = CHATBOT_SYSTEM_PROMPT;
 
+// Request pieces that never change are built once instead of on every call
+const SYSTEM_MESSAGE = Object.freeze({
+  role: 'system',
+  content: CHATBOT_SYSTEM_PROMPT
+});
+
+const BASE_REQUEST_PAYLOAD = Object.freeze({
+  model: CHATBOT_CONFIG.model,
+  maxTokens: CHATBOT_CONFIG.maxTokens,
+  temperature: CHATBOT_CONFIG.temperature
+});
+
 /**
  * Backend OpenAI service that calls your secure API endpoint instead of OpenAI directly
  */
@@ -42,19 +54,22 @@ export class BackendOpenAIService {
   /**
    * Send a chat completion request to your backend API
    * @param messages - Array of conversation messages
+   * @param onChunk - Optional callback receiving the accumulated text as it streams in
    * @returns Promise with API response or error
    */
-  public async sendChatCompletion(messages: Message[]): Promise<ApiServiceResponse<string>> {
+  public async sendChatCompletion(
+    messages: Message[],
+    onChunk?: (partial: string) => void
+  ): Promise<ApiServiceResponse<string>> {
     try {
       // Format messages for API
       const formattedMessages = this.formatMessagesForAPI(messages);
       
       // Create API request payload
       const requestPayload = {
+        ...BASE_REQUEST_PAYLOAD,
         messages: formattedMessages,
-        model: CHATBOT_CONFIG.model,
-        maxTokens: CHATBOT_CONFIG.maxTokens,
-        temperature: CHATBOT_CONFIG.temperature,
+        stream: Boolean(onChunk),
       };
 
       // Make API call to your backend with timeout
@@ -64,6 +79,11 @@ export class BackendOpenAIService {
         return this.handleAPIError(response);
       }
 
+      // Streamed responses are delivered as Server-Sent Events
+      if (onChunk && response.headers.get('Content-Type')?.includes('text/event-stream')) {
+        return this.readEventStream(response, onChunk);
+      }
+
       const data = await response.json();
       
       // Check if the response indicates success
@@ -94,14 +114,6 @@ export class BackendOpenAIService {
    * @returns Formatted messages array with system prompt
    */
   private formatMessagesForAPI(messages: Message[]): Array<{role: string; content: string}> {
-    // Start with system prompt
-    const formattedMessages = [
-      {
-        role: 'system',
-        content: CHATBOT_CONFIG.systemPrompt
-      }
-    ];
-
     // Optimize conversation context for API call
     const optimizedMessages = conversationContextService.prepareForAPI(messages, {
       maxMessages: CHATBOT_CONFIG.maxMessages,
@@ -109,15 +121,12 @@ export class BackendOpenAIService {
       prioritizeRecent: true
     });
 
-    // Add optimized conversation messages
-    optimizedMessages.forEach(message => {
-      formattedMessages.push({
-        role: message.role,
-        content: message.content
-      });
-    });
-
-    return formattedMessages;
+    // Start with the shared system message. It must stay first and byte-identical
+    // across requests so the provider can reuse its cached prompt prefix.
+    return [
+      SYSTEM_MESSAGE,
+      ...optimizedMessages.map(({ role, content }) => ({ role, content }))
+    ];
   }
 
   /**
@@ -153,6 +162,109 @@ export class BackendOpenAIService {
     }
   }
 
+  /**
+   * Read a Server-Sent Events response from the backend, reporting progress as it arrives
+   * @param response - Streaming fetch response
+   * @param onChunk - Callback receiving the accumulated text so far
+   * @returns Final response content or error
+   */
+  private async readEventStream(
+    response: Response,
+    onChunk: (partial: string) => void
+  ): Promise<ApiServiceResponse<string>> {
+    if (!response.body) {
+      return this.createStreamError('No response content received from AI service');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let content = '';
+
+    while (true) {
+      const { done, value } = await this.readWithIdleTimeout(reader);
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const events = buffer.split('\n\n');
+      buffer = events.pop() || '';
+
+      for (const event of events) {
+        if (!event.startsWith('data: ')) continue;
+
+        let data;
+        try {
+          data = JSON.parse(event.slice(6));
+        } catch {
+          reader.cancel().catch(() => {});
+          return this.createStreamError('Received a malformed response from AI service');
+        }
+
+        if (data.error) {
+          return this.createStreamError(data.error);
+        }
+
+        if (data.done) {
+          return {
+            success: true,
+            data: data.data
+          };
+        }
+
+        if (data.delta) {
+          content += data.delta;
+          onChunk(content);
+        }
+      }
+    }
+
+    // The stream ended without a completion event, so whatever arrived is truncated
+    return this.createStreamError('The response from AI service was interrupted');
+  }
+
+  /**
+   * Read the next stream chunk, cancelling the stream if it stalls
+   * @param reader - Stream reader
+   * @returns Next read result
+   */
+  private async readWithIdleTimeout(
+    reader: ReadableStreamDefaultReader<Uint8Array>
+  ): Promise<ReadableStreamReadResult<Uint8Array>> {
+    let timeoutId: ReturnType<typeof setTimeout> | undefined;
+
+    const idleTimeout = new Promise<never>((_, reject) => {
+      timeoutId = setTimeout(() => {
+        // Reported as a timeout by handleRequestError
+        const error = new Error('Stream idle timeout');
+        error.name = 'AbortError';
+        reject(error);
+        reader.cancel().catch(() => {});
+      }, CHATBOT_CONFIG.streamIdleTimeout);
+    });
+
+    try {
+      return await Promise.race([reader.read(), idleTimeout]);
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
+  /**
+   * Create a retryable error for a failed or incomplete stream
+   * @param message - Error message
+   * @returns Error response
+   */
+  private createStreamError(message: string): ApiServiceResponse<string> {
+    return {
+      success: false,
+      error: {
+        type: 'server',
+        message,
+        retryable: true
+      }
+    };
+  }
+
   /**
    * Handle API response errors
    * @param response - Failed fetch response
@@ -27,11 +27,13 @@ export class ChatbotService {
    * Send message to chatbot with retry logic and enhanced error handling
    * @param messages - Array of conversation messages
    * @param retryConfig - Optional retry configuration
+   * @param onChunk - Optional callback receiving the accumulated response while it streams
    * @returns Promise with chatbot response or error
    */
   async sendMessage(
     messages: Message[], 
-    retryConfig?: Partial<RetryConfig>
+    retryConfig?: Partial<RetryConfig>,
+    onChunk?: (partial: string) => void
   ): Promise<ApiServiceResponse<string>> {
     // Update retry configuration if provided
     if (retryConfig) {
@@ -55,7 +57,7 @@ export class ChatbotService {
 
     // Execute with retry logic using backend service
     return retryService.executeWithRetry(
-      () => backendOpenAIService.sendChatCompletion(messages),
+      () => backendOpenAIService.sendChatCompletion(messages, onChunk),
       this.isRetryableError
     );
   }
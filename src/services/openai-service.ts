@@ -13,6 +13,12 @@ import { conversationContextService } from './conversation-context-service';
 // Update the config with the system prompt
 CHATBOT_CONFIG.systemPrompt = CHATBOT_SYSTEM_PROMPT;
 
+// System message shared by every request instead of being rebuilt per call
+const SYSTEM_MESSAGE: OpenAIRequest['messages'][number] = Object.freeze({
+  role: 'system',
+  content: CHATBOT_SYSTEM_PROMPT
+});
+
 /**
  * OpenAI API service class for handling chat completions
  */
@@ -98,14 +104,6 @@ export class OpenAIService {
    * @returns Formatted messages array with system prompt
    */
   private formatMessagesForAPI(messages: Message[]): OpenAIRequest['messages'] {
-    // Start with system prompt
-    const formattedMessages: OpenAIRequest['messages'] = [
-      {
-        role: 'system',
-        content: CHATBOT_CONFIG.systemPrompt
-      }
-    ];
-
     // Optimize conversation context for API call
     const optimizedMessages = conversationContextService.prepareForAPI(messages, {
       maxMessages: CHATBOT_CONFIG.maxMessages,
@@ -113,15 +111,11 @@ export class OpenAIService {
       prioritizeRecent: true
     });
 
-    // Add optimized conversation messages
-    optimizedMessages.forEach(message => {
-      formattedMessages.push({
-        role: message.role,
-        content: message.content
-      });
-    });
-
-    return formattedMessages;
+    // Start with the shared system message, then the optimized conversation
+    return [
+      SYSTEM_MESSAGE,
+      ...optimizedMessages.map(({ role, content }) => ({ role, content }))
+    ];
   }
 
   /**
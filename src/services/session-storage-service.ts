@@ -3,8 +3,7 @@ import { Message, ChatSession } from '../components/chatbot/chatbot.types';
 
 export class SessionStorageService {
   private static readonly STORAGE_KEY = 'chatbot_messages';
-  private static readonly MAX_MESSAGES = 50; // Limit to prevent storage quota issues
-  private static readonly STORAGE_QUOTA_BUFFER = 0.1; // 10% buffer for storage quota
+  static readonly MAX_MESSAGES = 50; // Limit to prevent storage quota issues
 
   /**
    * Save messages to session storage with quota handling
@@ -19,22 +18,9 @@ export class SessionStorageService {
         timestamp: new Date()
       };
 
-      const serializedData = JSON.stringify(sessionData);
-      
-      // Check if we're approaching storage quota
-      if (this.isApproachingStorageQuota(serializedData)) {
-        // Remove older messages and try again
-        const reducedMessages = this.limitMessages(messages, Math.floor(this.MAX_MESSAGES / 2));
-        const reducedSessionData: ChatSession = {
-          messages: reducedMessages,
-          timestamp: new Date()
-        };
-        
-        sessionStorage.setItem(this.STORAGE_KEY, JSON.stringify(reducedSessionData));
-        console.warn('Storage quota approaching, reduced message history');
-      } else {
-        sessionStorage.setItem(this.STORAGE_KEY, serializedData);
-      }
+      // Write directly and let the quota error path below handle overflow,
+      // instead of probing available storage before every save
+      sessionStorage.setItem(this.STORAGE_KEY, JSON.stringify(sessionData));
       
       return true;
     } catch (error) {
@@ -159,21 +145,6 @@ export class SessionStorageService {
     }
   }
 
-  /**
-   * Check if we're approaching storage quota
-   */
-  private static isApproachingStorageQuota(data: string): boolean {
-    try {
-      const storageInfo = this.getStorageInfo();
-      const dataSize = data.length * 2; // Rough estimate for UTF-16 encoding
-      const projectedUsage = (storageInfo.used + dataSize) / (storageInfo.used + storageInfo.available);
-      
-      return projectedUsage > (1 - this.STORAGE_QUOTA_BUFFER);
-    } catch {
-      return false;
-    }
-  }
-
   /**
    * Check if error is related to storage quota
    */